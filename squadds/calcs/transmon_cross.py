@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from squadds.calcs.qubit import QubitHamiltonian
 from scqubits.core.transmon import Transmon
 from pyEPR.calcs import Convert
@@ -27,6 +26,7 @@ class TransmonCrossHamiltonian(QubitHamiltonian):
         Parameters:
         - data_frame: The DataFrame containing the data to be plotted.
         """
+        import matplotlib.pyplot as plt
         data_frame.plot(kind='box', subplots=True, layout=(1, 3), sharex=False, sharey=False)
         plt.show()
 
@@ -12,9 +12,133 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import math
+from functools import lru_cache
+
 import numpy as np
-from qiskit_metal import draw, Dict
+from qiskit_metal import Dict
 from qiskit_metal.qlibrary.core import BaseQubit
+import shapely
+from shapely.geometry import LineString, Polygon, box
+
+
+def _combined_affine(theta_deg, tx, ty, post_tx, post_ty):
+    """Returns the shapely affine matrix for translate -> rotate -> translate.
+
+    Equivalent to translating by (tx, ty), rotating by theta_deg about the
+    origin and then translating by (post_tx, post_ty), but applied in a single
+    pass over the coordinates.
+
+    Args:
+        theta_deg (float): Rotation angle in degrees (counter-clockwise)
+        tx (float): x offset applied before the rotation
+        ty (float): y offset applied before the rotation
+        post_tx (float): x offset applied after the rotation
+        post_ty (float): y offset applied after the rotation
+
+    Returns:
+        list: [a, b, d, e, xoff, yoff], in `shapely.affinity.affine_transform` order
+    """
+    theta = math.radians(theta_deg)
+    c, s = math.cos(theta), math.sin(theta)
+    return [c, -s, s, c, post_tx + c * tx - s * ty, post_ty + s * tx + c * ty]
+
+
+def _claw_outline(c_w, c_l, claw_height, c_c_w, c_c_l):
+    """Builds the claw connector arm as a single polygon.
+
+    The claw is a U (a `claw_height` tall box with a slot of depth `c_l` cut
+    from its open side) joined to the CPW stub on its back edge. All corners
+    are known, so the outline is traced directly instead of going through
+    box difference and union operations.
+
+    Args:
+        c_w (float): Claw width
+        c_l (float): Claw length
+        claw_height (float): Total height of the claw
+        c_c_w (float): Claw CPW width
+        c_c_l (float): Claw CPW length
+
+    Returns:
+        Polygon: The claw connector arm
+    """
+    h = claw_height / 2
+    return Polygon([(-c_w, -h), (c_l, -h), (c_l, -h + c_w), (0, -h + c_w),
+                    (0, h - c_w), (c_l, h - c_w), (c_l, h), (-c_w, h),
+                    (-c_w, c_c_w / 2), (-c_c_l - c_w, c_c_w / 2),
+                    (-c_c_l - c_w, -c_c_w / 2), (-c_w, -c_c_w / 2)])
+
+
+@lru_cache(maxsize=256)
+def _connector_template(connector_type, c_w, c_l, c_g, g_s, cross_gap,
+                        cross_width, c_c_w, c_c_l):
+    """Builds a connector pad in its local frame (before placement).
+
+    Cached so that sweeps over many qubits sharing the same pad options only
+    pay for the polygon construction and buffer once. Shapely geometries are
+    immutable, so the cached objects are shared safely between callers.
+
+    Args:
+        connector_type (int): 0 = Claw type, 1 = gap type
+        c_w (float): Claw width
+        c_l (float): Claw length
+        c_g (float): Claw gap
+        g_s (float): Ground spacing
+        cross_gap (float): Gap of the cross
+        cross_width (float): Width of the cross
+        c_c_w (float): Claw CPW width
+        c_c_l (float): Claw CPW length
+
+    Returns:
+        tuple: (connector_arm, connector_etcher, port_line)
+    """
+    if connector_type == 0:  # Claw connector
+        t_claw_height = 2*c_g + 2 * c_w + 2*g_s + \
+            2*cross_gap + cross_width  # temp value
+        connector_arm = _claw_outline(c_w, c_l, t_claw_height, c_c_w, c_c_l)
+        # All corners are right angles, so a single mitred offset is exact
+        connector_etcher = connector_arm.buffer(c_g, cap_style=2, join_style=2)
+    else:
+        connector_arm = box(0, -c_w / 2, -4 * c_w, c_w / 2)
+        # Mitred buffer of an axis-aligned box is the box grown by c_g
+        connector_etcher = box(c_g, -c_w / 2 - c_g, -4 * c_w - c_g,
+                               c_w / 2 + c_g)
+
+    # Making the pin for  tracking (for easy connect functions).
+    # Done here so as to have the same translations and rotations as the connector. Could
+    # extract from the connector later, but since allowing different connector types,
+    # this seems more straightforward.
+    port_line = LineString([(-c_c_l - c_w, -c_c_w / 2),
+                            (-c_c_l - c_w, c_c_w / 2)])
+
+    return connector_arm, connector_etcher, port_line
+
+
+def _place_templates(templates, matrices):
+    """Places connector templates with one vectorized coordinate transform.
+
+    Every geometry in ``templates[i]`` is transformed by ``matrices[i]``. All
+    coordinates are gathered into one array so shapely is only called once,
+    whatever the number of pads.
+
+    Args:
+        templates (list): Tuples of shapely geometries, one tuple per pad
+        matrices (list): Affine matrices from `_combined_affine`, one per pad
+
+    Returns:
+        np.ndarray: Placed geometries, with the same shape as `templates`
+    """
+    geoms = np.empty((len(templates), len(templates[0])), dtype=object)
+    geoms[:] = templates
+    counts = shapely.get_num_coordinates(geoms).ravel()
+    per_geom = np.repeat(np.asarray(matrices, dtype=float), geoms.shape[1], axis=0)
+    a, b, d, e, xoff, yoff = np.repeat(per_geom, counts, axis=0).T
+
+    def apply(xy):
+        x, y = xy[:, 0], xy[:, 1]
+        return np.column_stack((a * x + b * y + xoff, d * x + e * y + yoff))
+
+    return shapely.transform(geoms, apply)
 
 
 class TransmonClaw(BaseQubit):  # pylint: disable=invalid-name
@@ -142,9 +266,20 @@ class TransmonClaw(BaseQubit):  # pylint: disable=invalid-name
 ############################CONNECTORS##################################################################################################
 
     def make_connection_pads(self):
-        """Goes through connector pads and makes each one."""
-        for name in self.options.connection_pads:
-            self.make_connection_pad(name)
+        """Goes through connector pads and makes each one.
+
+        The templates of all pads are placed with a single vectorized
+        coordinate transform before their qgeometry is added.
+        """
+        names = list(self.options.connection_pads)
+        if not names:
+            return
+        # Parse the options once for all pads rather than on every self.p access
+        p = self.parse_options()
+        templates, matrices = zip(*(self._connection_pad_layout(p, name)
+                                    for name in names))
+        self._add_connection_pads(p, names,
+                                  _place_templates(templates, matrices))
 
     def make_connection_pad(self, name: str):
         """Makes individual connector pad.
@@ -152,17 +287,27 @@ class TransmonClaw(BaseQubit):  # pylint: disable=invalid-name
         Args:
             name (str) : Name of the connector pad
         """
+        p = self.parse_options()
+        template, matrix = self._connection_pad_layout(p, name)
+        self._add_connection_pads(p, [name],
+                                  _place_templates([template], [matrix]))
 
-        # self.p allows us to directly access parsed values (string -> numbers) form the user option
-        p = self.p
+    def _connection_pad_layout(self, p: Dict, name: str):
+        """Returns the local frame template of a connector pad and the affine
+        matrix that places it on the qubit.
+
+        Args:
+            p (Dict) : Parsed options of the qubit
+            name (str) : Name of the connector pad
+
+        Returns:
+            tuple: ((connector_arm, connector_etcher, port_line), matrix)
+        """
         cross_width = p.cross_width
         cross_length = p.cross_length
         cross_gap = p.cross_gap
 
-        # access to chip name
-        chip = p.chip
-
-        pc = self.p.connection_pads[name]  # parser on connector options
+        pc = p.connection_pads[name]  # parsed connector options
         c_g = pc.claw_gap
         c_l = pc.claw_length
         c_w = pc.claw_width
@@ -171,52 +316,47 @@ class TransmonClaw(BaseQubit):  # pylint: disable=invalid-name
         g_s = pc.ground_spacing
         con_loc = pc.connector_location
 
-        claw_cpw = draw.box(-c_w, -c_c_w / 2, -c_c_l - c_w, c_c_w / 2)
-
-        if pc.connector_type == 0:  # Claw connector
-            t_claw_height = 2*c_g + 2 * c_w + 2*g_s + \
-                2*cross_gap + cross_width  # temp value
-
-            claw_base = draw.box(-c_w, -(t_claw_height) / 2, c_l,
-                                 t_claw_height / 2)
-            claw_subtract = draw.box(0, -t_claw_height / 2 + c_w, c_l,
-                                     t_claw_height / 2 - c_w)
-            claw_base = claw_base.difference(claw_subtract)
-
-            connector_arm = draw.shapely.ops.unary_union([claw_base, claw_cpw])
-            connector_etcher = draw.buffer(connector_arm, c_g)
-        else:
-            connector_arm = draw.box(0, -c_w / 2, -4 * c_w, c_w / 2)
-            connector_etcher = draw.buffer(connector_arm, c_g)
-
-        # Making the pin for  tracking (for easy connect functions).
-        # Done here so as to have the same translations and rotations as the connector. Could
-        # extract from the connector later, but since allowing different connector types,
-        # this seems more straightforward.
-        port_line = draw.LineString([(-c_c_l - c_w, -c_c_w / 2),
-                                     (-c_c_l - c_w, c_c_w / 2)])
-
-        claw_rotate = 0
-        if con_loc > 135:
-            claw_rotate = 180
-        elif con_loc > 45:
-            claw_rotate = -90
+        # Rounded to 1e-9 mm so floating point noise from unit parsing
+        # does not defeat the template cache
+        template = _connector_template(
+            pc.connector_type, *(round(v, 9) for v in (c_w, c_l, c_g, g_s,
+                                                       cross_gap, cross_width,
+                                                       c_c_w, c_c_l)))
+
+        # 0 => 'west' arm (0), 90 => 'north' arm (-90), 180 => 'east' arm (180)
+        claw_rotate = 180 * (con_loc > 135) - 90 * (45 < con_loc <= 135)
 
         # Rotates and translates the connector polygons (and temporary port_line)
-        polys = [connector_arm, connector_etcher, port_line]
-        polys = draw.translate(polys, -(cross_length + cross_gap + g_s + c_g),
-                               0)
-        polys = draw.rotate(polys, claw_rotate, origin=(0, 0))
-        polys = draw.rotate(polys, p.orientation, origin=(0, 0))
-        polys = draw.translate(polys, p.pos_x, p.pos_y)
-        [connector_arm, connector_etcher, port_line] = polys
+        matrix = _combined_affine(claw_rotate + p.orientation,
+                                  -(cross_length + cross_gap + g_s + c_g), 0,
+                                  p.pos_x, p.pos_y)
+        return template, matrix
+
+    def _add_connection_pads(self, p: Dict, names, placed):
+        """Adds the qgeometry and pins of placed connector pads.
+
+        The arms and etches of all pads go in with one `add_qgeometry` call
+        each, rather than two calls per pad.
+
+        Args:
+            p (Dict): Parsed options of the qubit
+            names (list): Names of the connector pads
+            placed (np.ndarray): (connector_arm, connector_etcher, port_line)
+                for each pad, as returned by `_place_templates`
+        """
+        # access to chip name
+        chip = p.chip
+
+        arms = {}
+        etchers = {}
+        for name, (connector_arm, connector_etcher, _) in zip(names, placed):
+            arms[f'{name}_connector_arm'] = connector_arm
+            etchers[f'{name}_connector_etcher'] = connector_etcher
 
         # Generates qgeometry for the connector pads
-        self.add_qgeometry('poly', {f'{name}_connector_arm': connector_arm},
-                           chip=chip)
-        self.add_qgeometry('poly',
-                           {f'{name}_connector_etcher': connector_etcher},
-                           subtract=True,
-                           chip=chip)
-
-        self.add_pin(name, port_line.coords, c_c_w)
+        self.add_qgeometry('poly', arms, chip=chip)
+        self.add_qgeometry('poly', etchers, subtract=True, chip=chip)
+
+        for name, (_, _, port_line) in zip(names, placed):
+            self.add_pin(name, port_line.coords,
+                         p.connection_pads[name].claw_cpw_width)
@@ -5,6 +5,9 @@ from qiskit_metal.qlibrary.core import QRoute, QRoutePoint
 from qiskit_metal.qlibrary.core import QComponent
 # from cavity_feedline import CavityFeedline
 from qiskit_metal.qlibrary.qubits.transmon_cross import TransmonCross
+from qiskit_metal.qlibrary.couplers.coupled_line_tee import CoupledLineTee
+from qiskit_metal.qlibrary.couplers.cap_n_interdigital_tee import CapNInterdigitalTee
+from qiskit_metal.qlibrary.tlines.meandered import RouteMeander
 
 class QubitCavity(QComponent):
     
@@ -72,6 +75,7 @@ class QubitCavity(QComponent):
     
     def make(self):
         p = self.p
+        self._coupling_type = p.cavity_options['coupling_type'].lower()
         self.make_qubit()
         self.make_cavity()
         self.make_pins()
@@ -85,7 +89,7 @@ class QubitCavity(QComponent):
         qubit_opts["pos_y"] = 0
         qubit_opts["pos_x"] = "-1500um" if p.cavity_options['cpw_options'].total_length > 2.500 else "-1000um"
         # print(qubit_opts)
-        self.qubit = TransmonCross(self.design, "{}_xmon".format(self.name), options = qubit_opts)
+        self.qubit = TransmonCross(self.design, f"{self.name}_xmon", options = qubit_opts)
         # self.add_qgeometry('poly', self.qubit.qgeometry_dict('poly'), subtract = True, chip = p.chip)
 
     def make_cavity(self):
@@ -129,104 +133,61 @@ class QubitCavity(QComponent):
         # for k in p.coupler_options:
         #     temp_opts.update({k:p.cavity_options.coupler_options[k]})
 
-        if(p.cavity_options['coupling_type'].upper() == "CLT"):
-            from qiskit_metal.qlibrary.couplers.coupled_line_tee import CoupledLineTee
-            self.coupler = CoupledLineTee(self.design, "{}_CLT_coupler".format(self.name), options=temp_opts)
+        if(self._coupling_type == "clt"):
+            self.coupler = CoupledLineTee(self.design, f"{self.name}_CLT_coupler", options=temp_opts)
         # elif(p.cavity_options['coupling_type'] == 'inductive'):
         #     from inductive_coupler import InductiveCoupler
         #     self.coupler = InductiveCoupler(self.design, "{}_ind_coupler".format(self.name), options=temp_opts)
-        elif(p.cavity_options['coupling_type'].lower() == 'capn' or p.cavity_options['coupling_type'].lower() == 'ncap'):
-            from qiskit_metal.qlibrary.couplers.cap_n_interdigital_tee import CapNInterdigitalTee
-            self.coupler = CapNInterdigitalTee(self.design, '{}_capn_coupler'.format(self.name), options=temp_opts)
+        elif(self._coupling_type in ('capn', 'ncap')):
+            self.coupler = CapNInterdigitalTee(self.design, f'{self.name}_capn_coupler', options=temp_opts)
         # self.add_qgeometry('path', self.coupler.qgeometry_dict('path'), chip = p.chip)
         # self.add_qgeometry('poly', self.coupler.qgeometry_dict('poly'), chip = p.chip)
 
     def make_cpws(self):
         # print(f"COUPLER NAME: " + self.coupler.name)
-        from qiskit_metal.qlibrary.tlines.meandered import RouteMeander
-
         p = self.p
         p.cpw_options = p.cavity_options['cpw_options']
         
-        left_opts = Dict()
-        left_opts.update({'total_length': (p.cpw_options.total_length if p.cavity_options['coupling_type'] == 'capacitive' else p.cpw_options.total_length/2) })
-        left_opts.update({'pin_inputs':Dict(
-                                            start_pin = Dict(
-                                                component = '',
-                                                pin = ''
-                                            ),
-                                            end_pin = Dict(
-                                                component = '',
-                                                pin = ''
-                                            )
-                                            )})
+        left_opts = Dict(total_length = (p.cpw_options.total_length if self._coupling_type == 'capacitive' else p.cpw_options.total_length/2))
         self.copier(left_opts, p.cpw_options.left_options)
 
-        # if left_opts["lead"]["start_straight"] == None:
-        #     left_opts["lead"]["start_straight"] = 0 
-        # if left_opts["lead"]["end_straight"] == None:
-        #     left_opts["lead"]["end_straight"] = 0 
-        # if left_opts["lead"]["start_jogged_extension"] == None:
-        #     left_opts["lead"]["start_jogged_extension"] = 0 
-        # if left_opts["lead"]["end_jogged_extension"] == None:
-        #     left_opts["lead"]["end_jogged_extension"] = 0 
-        # print(self.coupler.options["coupling_length"])
+        first_pad = next(iter(self.qubit.options["connection_pads"]))
         adj_distance = self.coupler.options["coupling_length"] if self.coupler.options["coupling_length"] > 0.150 else 0
         jogs = OrderedDict()
         jogs[0] = ["R90", f'{adj_distance/(1.5)}um']
-        left_opts.update({"lead" : Dict(
-                                start_straight = "100um",
-                                end_straight = "50um",
-                                
-                                start_jogged_extension = jogs
-                                )})
-        left_opts.update({"pin_inputs" : Dict(start_pin = Dict(component = self.coupler.name,
-                                                        pin = 'second_end'),
-                                    end_pin = Dict(component = self.qubit.name,
-                                                    pin = list(self.qubit.options["connection_pads"].keys())[0]))})
-        left_opts.update({"meander" : Dict(
-                                    spacing = "100um",
-                                    asymmetry = f'{adj_distance/(3)}um' # need this to make CPW asymmetry half of the coupling length
-                                    )})                                 # if not, sharp kinks occur in CPW :(
-        # cpw = RouteMeander(design, 'cpw', options = opts)
-
-        left_opts['pin_inputs']['start_pin'].update({'component':self.qubit.name})
-        left_opts['pin_inputs']['start_pin'].update({'pin':list(self.qubit.options["connection_pads"].keys())[0]})
-
-        left_opts['pin_inputs']['end_pin'].update({'component':self.coupler.name})
-        left_opts['pin_inputs']['end_pin'].update({'pin':'second_end'})
-
-        # print(p.cpw_options.left_options)
-
-
-        # print(left_opts)
-
-        self.LeftMeander = RouteMeander(self.design, "{}_left_cpw".format(self.name), options = left_opts)
+        left_opts.update(Dict(
+            lead = Dict(
+                start_straight = "100um",
+                end_straight = "50um",
+                start_jogged_extension = jogs
+            ),
+            pin_inputs = Dict(
+                start_pin = Dict(component = self.qubit.name, pin = first_pad),
+                end_pin = Dict(component = self.coupler.name, pin = 'second_end')
+            ),
+            meander = Dict(
+                spacing = "100um",
+                asymmetry = f'{adj_distance/(3)}um' # need this to make CPW asymmetry half of the coupling length
+            )                                       # if not, sharp kinks occur in CPW :(
+        ))
+
+        self.LeftMeander = RouteMeander(self.design, f"{self.name}_left_cpw", options = left_opts)
         # self.add_qgeometry('path', self.LeftMeander.qgeometry_dict('path'), chip = p.chip)
         # self.add_qgeometry('poly', self.LeftMeander.qgeometry_dict('poly'), chip = p.chip)
 
-        if(p.cavity_options['coupling_type'] == 'inductive'):
-            right_opts = Dict()
-            right_opts.update({'total_length':p.cpw_options.total_length/2})
-            right_opts.update({'pin_inputs':Dict(
-                                                start_pin = Dict(
-                                                    component = '',
-                                                    pin = ''
-                                                ),
-                                                end_pin = Dict(
-                                                    component = '',
-                                                    pin = ''
-                                                )
-                                                )})
-            right_opts['pin_inputs']['end_pin'].update({'component':p.cpw_options.pin_inputs.end_pin.component})
-            right_opts['pin_inputs']['end_pin'].update({'pin':p.cpw_options.pin_inputs.end_pin.pin})
-
-            right_opts['pin_inputs']['start_pin'].update({'component':self.coupler.name})
-            right_opts['pin_inputs']['start_pin'].update({'pin':'second_start'})
+        if(self._coupling_type == 'inductive'):
+            right_opts = Dict(
+                total_length = p.cpw_options.total_length/2,
+                pin_inputs = Dict(
+                    start_pin = Dict(component = self.coupler.name, pin = 'second_start'),
+                    end_pin = Dict(component = p.cpw_options.pin_inputs.end_pin.component,
+                                   pin = p.cpw_options.pin_inputs.end_pin.pin)
+                )
+            )
 
             self.copier(right_opts, p.cpw_options.right_options)
 
-            self.RightMeander = RouteMeander(self.design, "{}_right_cpw".format(self.name), options = right_opts)
+            self.RightMeander = RouteMeander(self.design, f"{self.name}_right_cpw", options = right_opts)
             self.add_qgeometry('path', self.RightMeander.qgeometry_dict('path'), chip = p.chip)
             # self.add_qgeometry('poly', self.RightMeander.qgeometry_dict('poly'), chip = p.chip)
 
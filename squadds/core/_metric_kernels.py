@@ -0,0 +1,118 @@
+"""
+Distance kernels behind the batch metric strategies in `squadds.core.metrics`.
+
+Every kernel takes a (n_designs, n_params) matrix `X` and a target vector `t` and returns one
+distance per row. When numba is installed the kernels are compiled into a single fused loop
+over the rows, split across threads by `prange` and run without holding the GIL, so other
+Python threads keep running during a scan; otherwise the equivalent NumPy expressions are used.
+
+Calls into the compiled kernels are serialised by a lock: numba falls back to its `workqueue`
+threading layer when neither TBB nor OpenMP is available, and that layer aborts the process if two
+threads launch parallel kernels at the same time. Each scan already uses every core.
+"""
+import threading
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+COMPILED = njit is not None
+
+# Fast-math flags that still let reductions vectorize, without the no-NaN/no-inf assumptions:
+# designs with missing parameters must come out as NaN distances, as with the NumPy expressions
+_FASTMATH = {'reassoc', 'contract', 'arcp'}
+
+if njit is not None:
+
+    def _specialize_weighted_relative_sq(n_params):
+        """Compile `weighted_relative_sq` with the number of parameters frozen as a constant."""
+
+        @njit(parallel=True, fastmath=_FASTMATH, nogil=True, boundscheck=False, cache=True)
+        def kernel(X, t, w):
+            out = np.empty(X.shape[0], dtype=X.dtype)
+            for i in prange(X.shape[0]):
+                s = 0.0
+                for j in range(n_params):
+                    d = (X[i, j] - t[j]) / t[j]
+                    s += w[j] * d * d
+                out[i] = s
+            return out
+
+        return kernel
+
+    _weighted_relative_sq_kernels = {}
+    _kernel_lock = threading.Lock()
+
+    def weighted_relative_sq(X, t, w):
+        """sum_j w_j * (X_ij - t_j)^2 / t_j^2 for every row i."""
+        # Libraries have only a handful of H parameters; a constant trip count lets LLVM
+        # fully unroll the inner loop and keep the target in registers
+        n_params = X.shape[1]
+        with _kernel_lock:
+            if n_params not in _weighted_relative_sq_kernels:
+                _weighted_relative_sq_kernels[n_params] = _specialize_weighted_relative_sq(n_params)
+            return _weighted_relative_sq_kernels[n_params](X, t, w)
+
+    def manhattan(X, t):
+        """sum_j |X_ij - t_j| for every row i."""
+        with _kernel_lock:
+            return _manhattan(X, t)
+
+    def chebyshev(X, t):
+        """max_j |X_ij - t_j| for every row i."""
+        with _kernel_lock:
+            return _chebyshev(X, t)
+
+    @njit(parallel=True, fastmath=_FASTMATH, nogil=True, boundscheck=False, cache=True)
+    def _manhattan(X, t):
+        out = np.empty(X.shape[0], dtype=X.dtype)
+        for i in prange(X.shape[0]):
+            s = 0.0
+            for j in range(X.shape[1]):
+                s += abs(X[i, j] - t[j])
+            out[i] = s
+        return out
+
+    @njit(parallel=True, fastmath=_FASTMATH, nogil=True, boundscheck=False, cache=True)
+    def _chebyshev(X, t):
+        out = np.empty(X.shape[0], dtype=X.dtype)
+        for i in prange(X.shape[0]):
+            s = 0.0
+            for j in range(X.shape[1]):
+                d = abs(X[i, j] - t[j])
+                if d > s or d != d:
+                    s = d
+            out[i] = s
+        return out
+
+else:
+
+    def weighted_relative_sq(X, t, w):
+        """sum_j w_j * (X_ij - t_j)^2 / t_j^2 for every row i."""
+        diff = X - t
+        diff /= t
+        return np.einsum('ij,ij,j->i', diff, diff, w)
+
+    def manhattan(X, t):
+        """sum_j |X_ij - t_j| for every row i."""
+        return np.abs(X - t).sum(axis=1)
+
+    def chebyshev(X, t):
+        """max_j |X_ij - t_j| for every row i."""
+        return np.abs(X - t).max(axis=1)
+
+
+def weighted_relative_sq_expanded(X, X_sq, t, w):
+    """
+    Same as `weighted_relative_sq`, expanded as X^2 u - 2 X (u t) + (u t) t with u = w / t^2.
+
+    With `X_sq = X**2` precomputed, a query costs two BLAS matrix-vector products and no
+    (n_designs, n_params) temporaries. The subtraction cancels for close matches, so only use
+    this on float64 data.
+    """
+    u = w / (t * t)
+    ut = u * t
+    return X_sq @ u - 2 * (X @ ut) + ut @ t
@@ -1,8 +1,11 @@
+import logging
+
+import numpy as np
 import pandas as pd
+from scipy.spatial import cKDTree
 from squadds.calcs.transmon_cross import TransmonCrossHamiltonian
-import seaborn as sns
-from squadds.core.metrics import *
-import matplotlib.pyplot as plt
+from squadds.core.metrics import (MetricStrategy, EuclideanMetric, ManhattanMetric, ChebyshevMetric,
+                                  WeightedEuclideanMetric, CustomMetric)
 
 """
 =====================================================================================
@@ -24,15 +27,92 @@ def scale_value(value, ratio):
     scaled_value = str(float(value.replace('um', '')) * ratio) + 'um'
     return scaled_value
 
+def scale_values_batch(values, ratio):
+    """
+    Scales every 'um' value of a dict (or every 'um' column of a DataFrame) by the specified ratio.
+
+    Parameters:
+    values (dict or pd.DataFrame): Mapping of names to values. Only string values ending in 'um' are scaled.
+    ratio (float): The scaling ratio.
+
+    Returns:
+    dict or pd.DataFrame: A copy of `values` with the 'um' values scaled, formatted as in `scale_value`.
+    """
+    if isinstance(values, pd.DataFrame):
+        scaled = values.copy()
+        for column in values.columns:
+            if pd.api.types.is_string_dtype(values[column]) and values[column].str.endswith('um', na=False).all():
+                numbers = values[column].str.slice(0, -2).astype(np.float64) * ratio
+                scaled[column] = numbers.astype(str) + 'um'
+        return scaled
+    keys = [key for key, value in values.items() if isinstance(value, str) and value.endswith('um')]
+    numbers = np.fromiter((float(values[key][:-2]) for key in keys), dtype=np.float64, count=len(keys)) * ratio
+    return {**values, **{key: f'{number}um' for key, number in zip(keys, numbers.tolist())}}
+
+def equals_mask(column, value):
+    """
+    Element-wise equality of a column with a scalar, as a boolean array.
+
+    Categorical columns are compared on their integer codes.
+
+    Parameters:
+    column (pd.Series): The column to compare.
+    value: The value to compare against.
+
+    Returns:
+    np.ndarray: Boolean array, True where the column equals `value`.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        categories = column.cat.categories
+        if value not in categories:
+            return np.zeros(len(column), dtype=bool)
+        return column.cat.codes.to_numpy() == categories.get_loc(value)
+    return column.to_numpy() == value
+
 """
 =====================================================================================
 Analyzer
 =====================================================================================
 """
+# Components making up the coupled qubit-cavity system, in either order
+QUBIT_CAVITY_SYSTEM = frozenset({"qubit", "cavity_claw"})
+
+# String-valued library columns that are filtered on by equality
+CATEGORICAL_COLUMNS = ("resonator_type", "coupler_type")
+
+def system_key(system):
+    """
+    Normalize a selected system to a hashable key, so ["qubit", "cavity_claw"] and
+    ["cavity_claw", "qubit"] map to the same entry of the dispatch tables below.
+
+    Parameters:
+    system (str or list): The selected system.
+
+    Returns:
+    str or frozenset: The key.
+    """
+    return frozenset(system) if isinstance(system, list) else system
+
+#TODO: make this more general and read the param keys from the database
+# Hamiltonian parameter keys of each system
+_H_PARAM_KEYS = {
+    "qubit": ("qubit_frequency_GHz", "anharmonicity_MHz"),
+    "cavity_claw": ("resonator_type", "cavity_frequency_GHz", "kappa_kHz"),
+    "coupler": None,
+    QUBIT_CAVITY_SYSTEM: ("qubit_frequency_GHz", "anharmonicity_MHz", "resonator_type", "cavity_frequency_GHz", "kappa_kHz", "g_MHz"),
+}
+
+# Metrics without parameters are stateless, so one instance serves every query
+_METRIC_SINGLETONS = {
+    'Euclidean': EuclideanMetric(),
+    'Manhattan': ManhattanMetric(),
+    'Chebyshev': ChebyshevMetric(),
+}
+
 class Analyzer:
 
-    __supported_metrics__ = ['Euclidean', 'Manhattan', 'Chebyshev', 'Weighted Euclidean' , 'Custom']
-    __supported_estimation_methods__ = ['Interpolation']
+    __supported_metrics__ = frozenset({'Euclidean', 'Manhattan', 'Chebyshev', 'Weighted Euclidean', 'Custom'})
+    __supported_estimation_methods__ = frozenset({'Interpolation'})
 
     def __init__(self, db):
         """
@@ -71,7 +151,10 @@ class Analyzer:
         self.custom_metric_func = None
         self.metric_weights = None
         self.target_params = None
-        
+        self._reset_query_caches()
+        self._H_params_added_for = None
+        self._H_params_df = None
+
         self.H_param_keys = self._get_H_param_keys()
         
     def _add_target_params_columns(self):
@@ -83,23 +166,41 @@ class Analyzer:
         If the selected system is "coupler", it does nothing.
         If the selected system is ["qubit", "cavity_claw"] or ["cavity_claw", "qubit"], it fixes the dataframe for the cavity_claw system and adds cavity-coupled Hamiltonian parameters to the dataframe.
         Raises a ValueError if the selected system is invalid.
+
+        The columns are only recomputed when `self.df` was replaced, or when the system or the
+        target qubit parameters (which set EJ) changed since the last call.
         """
-        #TODO: make this more general and read the param keys from the database
-        if self.selected_system == "qubit":
-            qubit_H = TransmonCrossHamiltonian(self)
-            qubit_H.add_qubit_H_params()
-            self.df = qubit_H.df 
-        elif self.selected_system == "cavity_claw":
-            self._fix_cavity_claw_df()
-        elif self.selected_system == "coupler":
-            pass
-        elif (self.selected_system == ["qubit","cavity_claw"]) or (self.selected_system == ["cavity_claw","qubit"]):
-            self._fix_cavity_claw_df()
-            qubit_H = TransmonCrossHamiltonian(self)
-            qubit_H.add_cavity_coupled_H_params()
-            self.df = qubit_H.df 
-        else:
+        system = system_key(self.selected_system)
+        if system not in _H_PARAM_ADDERS:
             raise ValueError("Invalid system.")
+        H_params_for = (system, self.target_params.get("qubit_frequency_GHz"), self.target_params.get("anharmonicity_MHz"))
+        if H_params_for == self._H_params_added_for and self.df is self._H_params_df:
+            return
+
+        adder = _H_PARAM_ADDERS[system]
+        if adder is not None:
+            adder(self)
+        self._H_params_added_for = H_params_for
+        self._H_params_df = self.df
+
+    def _add_qubit_H_params(self):
+        """
+        Add the qubit Hamiltonian parameters to the dataframe.
+        """
+        qubit_H = TransmonCrossHamiltonian(self)
+        qubit_H.add_qubit_H_params()
+        self.df = qubit_H.df
+        self._reset_query_caches()
+
+    def _add_qubit_cavity_H_params(self):
+        """
+        Fix the cavity claw columns and add the cavity-coupled Hamiltonian parameters to the dataframe.
+        """
+        self._fix_cavity_claw_df()
+        qubit_H = TransmonCrossHamiltonian(self)
+        qubit_H.add_cavity_coupled_H_params()
+        self.df = qubit_H.df
+        self._reset_query_caches()
     
     def _fix_cavity_claw_df(self):
         """
@@ -116,40 +217,143 @@ class Analyzer:
             None
         """
         if ("cavity_frequency" in self.df.columns) or ("kappa" in self.df.columns):
-            self.df = self.df.rename(columns={"cavity_frequency": "cavity_frequency_GHz", "kappa": "kappa_kHz"})
-            self.df["cavity_frequency_GHz"] = self.df["cavity_frequency_GHz"] * 1e-9
-            self.df["kappa_kHz"] = self.df["kappa_kHz"] * 1e-3
+            # assign() builds a new frame, so the library held by the database is never modified
+            df = self.df.rename(columns={"cavity_frequency": "cavity_frequency_GHz", "kappa": "kappa_kHz"})
+            converted = {"cavity_frequency_GHz": df["cavity_frequency_GHz"] * 1e-9, "kappa_kHz": df["kappa_kHz"] * 1e-3}
+            for column in CATEGORICAL_COLUMNS:
+                if column in df.columns:
+                    converted[column] = df[column].astype("category")
+            self.df = df.assign(**converted)
+            self._reset_query_caches()
         else:
             pass
     
+    def _reset_query_caches(self):
+        """
+        Drop the numerical matrices, column bounds, categorical masks, design lists and KD-trees derived from `self.df`.
+
+        Must be called whenever the Hamiltonian parameter columns of `self.df` change in place.
+        """
+        self._kdtrees = {}
+        self._numeric_matrices = {}
+        self._column_bounds = {}
+        self._categorical_masks = {}
+        self._design_option_lists = {}
+        self._query_caches_df = self.df
+
+    def _sync_query_caches(self):
+        """
+        Drop the caches derived from `self.df` if it was replaced since they were built.
+        """
+        if self.df is not self._query_caches_df:
+            self._reset_query_caches()
+
+    def _design_option(self, column, position):
+        """
+        Return the design dict stored in `column` at row `position` of `self.df`.
+
+        The column is converted to a plain list once, so later lookups skip pandas indexing.
+
+        Args:
+            column (str): Name of a design options column.
+            position (int): Row position in `self.df`.
+
+        Returns:
+            dict: The design options.
+        """
+        if column not in self._design_option_lists:
+            self._design_option_lists[column] = self.df[column].tolist()
+        return self._design_option_lists[column][position]
+
+    def _bounds(self, df, param):
+        """
+        Return the (min, max) of a numerical column, ignoring NaNs.
+
+        Bounds of `self.df` are cached until the library changes.
+
+        Args:
+            df (pd.DataFrame): Dataframe holding the column.
+            param (str): Column name.
+
+        Returns:
+            tuple: Minimum and maximum of the column, or NaNs if it is empty.
+        """
+        self._sync_query_caches()
+        if df is self.df and param in self._column_bounds:
+            return self._column_bounds[param]
+        column = df[param].to_numpy(dtype=np.float64)
+        bounds = (np.nanmin(column), np.nanmax(column)) if column.size else (np.nan, np.nan)
+        if df is self.df:
+            self._column_bounds[param] = bounds
+        return bounds
+
+    def _categorical_mask(self, df, param, value):
+        """
+        Return the rows of `df` whose `param` column equals `value`, as a boolean array.
+
+        Masks over `self.df` are cached per (param, value) until the library changes, so repeated
+        queries on the same resonator or coupler type only AND precomputed arrays.
+
+        Args:
+            df (pd.DataFrame): Dataframe holding the column.
+            param (str): Column name.
+            value (str): Value to match.
+
+        Returns:
+            np.ndarray: Read-only boolean array with one entry per row of `df`.
+        """
+        self._sync_query_caches()
+        if df is not self.df:
+            return equals_mask(df[param], value)
+        key = (param, value)
+        if key not in self._categorical_masks:
+            mask = equals_mask(df[param], value)
+            mask.flags.writeable = False
+            self._categorical_masks[key] = mask
+        return self._categorical_masks[key]
+
+    def _numeric_matrix(self, numeric_keys, precision='float32', squared=False):
+        """
+        Return the `numeric_keys` columns of `self.df` as a C-contiguous floating point matrix.
+
+        The matrix is built once per set of keys and precision, and reused until the library changes.
+
+        Args:
+            numeric_keys (list): Names of the numerical columns.
+            precision (str, optional): 'float32' or 'float64'. Defaults to 'float32'.
+            squared (bool, optional): Return the element-wise square of the matrix instead. Defaults to False.
+
+        Returns:
+            np.ndarray: Matrix with one row per design and one column per key.
+        """
+        key = (tuple(numeric_keys), precision, squared)
+        if key not in self._numeric_matrices:
+            if squared:
+                self._numeric_matrices[key] = np.square(self._numeric_matrix(numeric_keys, precision))
+            else:
+                self._numeric_matrices[key] = np.ascontiguousarray(self.df[numeric_keys].to_numpy(dtype=precision))
+        return self._numeric_matrices[key]
+
     def _get_H_param_keys(self):
         """
         Get the parameter keys for the Hamiltonian (H) based on the selected system.
 
         Returns:
-            list: A list of parameter keys for the Hamiltonian.
+            tuple: The parameter keys for the Hamiltonian.
         
         Raises:
             ValueError: If the selected system is invalid.
         """
-        #TODO: make this more general and read the param keys from the database
-        self.H_param_keys = None
-        if self.selected_system == "qubit":
-            self.H_param_keys = ["qubit_frequency_GHz", "anharmonicity_MHz"]
-        elif self.selected_system == "cavity_claw":
-            self.H_param_keys = ["resonator_type", "cavity_frequency_GHz", "kappa_kHz"]
-        elif self.selected_system == "coupler":
-            pass
-        elif (self.selected_system == ["qubit","cavity_claw"]) or (self.selected_system == ["cavity_claw","qubit"]):
-            self.H_param_keys = ["qubit_frequency_GHz", "anharmonicity_MHz", "resonator_type", "cavity_frequency_GHz", "kappa_kHz", "g_MHz"]
-        else:
+        system = system_key(self.selected_system)
+        if system not in _H_PARAM_KEYS:
             raise ValueError("Invalid system.")
+        self.H_param_keys = _H_PARAM_KEYS[system]
         return self.H_param_keys
 
     def target_param_keys(self):
         """
         Returns:
-            list: The target parameter keys.
+            tuple: The target parameter keys.
         """
         return self.H_param_keys
 
@@ -176,28 +380,33 @@ class Analyzer:
         
         Returns:
             bool: True if any value is outside of bounds. False if all values are inside bounds.
+
+        With `display=False` nothing is logged, so the categorical filtering is skipped as soon as
+        a numerical value is found to be outside of bounds.
         """
         outside_bounds = False
 
-        filtered_df = df.copy()
+        mask = np.ones(len(df), dtype=bool)
 
         for param, value in params.items():
             if param not in df.columns:
-                raise ValueError(f"{param} is not a column in dataframe: {df}")
+                raise ValueError(f"{param} is not a column in dataframe. Available columns: {list(df.columns)}")
 
             if isinstance(value, (int, float)):
-                if value < df[param].min() or value > df[param].max():
+                lower, upper = self._bounds(df, param)
+                if value < lower or value > upper:
                     if display:
                         logging.info(f"\033[1mNOTE TO USER:\033[0m the value \033[1m{value} for {param}\033[0m is outside the bounds of our library.\nIf you find a geometry which corresponds to these values, please consider contributing it! 😁🙏\n")
                     outside_bounds = True
 
             elif isinstance(value, str):
-                filtered_df = filtered_df[filtered_df[param] == value]
+                if display or not outside_bounds:
+                    mask &= self._categorical_mask(df, param, value)
 
             else:
                 raise ValueError(f"Unsupported type {type(value)} for parameter {param}")
 
-        if filtered_df.empty:
+        if (display or not outside_bounds) and not mask.any():
             categorical_params = {key: value for key, value in params.items() if isinstance(value, str)}
             if display and categorical_params:
                 logging.info(f"\033[1mNOTE TO USER:\033[0m There are no geometries with the specified categorical parameters - \033[1m{categorical_params}\033[0m.\nIf you find a geometry which corresponds to these values, please consider contributing it! 😁🙏\n")
@@ -210,7 +419,8 @@ class Analyzer:
                          target_params: dict,
                          num_top: int,
                          metric: str = 'Euclidean',
-                         display: bool = True):
+                         display: bool = True,
+                         precision: str = 'float32'):
         """
         Find the closest designs in the library based on the target parameters.
 
@@ -219,36 +429,48 @@ class Analyzer:
         - num_top (int): The number of closest designs to retrieve.
         - metric (str, optional): The distance metric to use for calculating distances. Defaults to 'Euclidean'.
         - display (bool, optional): Whether to display warnings for parameters outside of the library bounds. Defaults to True.
+        - precision (str, optional): Floating point type used for ranking distances, 'float32' or 'float64'. Defaults to 'float32', which halves the memory traffic of the scan; the returned values are unaffected.
 
         Returns:
         - closest_df (DataFrame): A DataFrame containing the closest designs.
 
         Raises:
         - ValueError: If the specified metric is not supported or if num_top is bigger than the size of the library.
+        - ValueError: If the precision is not 'float32' or 'float64'.
+        - ValueError: If no design matches the categorical target parameters.
         - ValueError: If the metric is invalid.
         """
         ### Checks
         # Check for supported metric
         if metric not in self.__supported_metrics__:
-            raise ValueError(f'`metric` must be one of the following: {self.__supported_metrics__}')
+            raise ValueError(f'`metric` must be one of the following: {sorted(self.__supported_metrics__)}')
         # Check for improper size of library
         if (num_top > len(self.df)):
             raise ValueError('`num_top` cannot be bigger than size of read-in library.')
+        # Check for supported precision
+        if precision not in ('float32', 'float64'):
+            raise ValueError("`precision` must be either 'float32' or 'float64'.")
 
-        self.target_params = target_params
+        self.target_params = dict(target_params)  # keep our own copy; later edits to the caller's dict must not leak in
         self._add_target_params_columns()
+        self._sync_query_caches()
 
         # Log if parameters outside of library
-        filtered_df = self.df[self.target_params]  # Filter DataFrame based on H_param_keys
-        self._outside_bounds(df=filtered_df, params=target_params, display=display)
+        self._outside_bounds(df=self.df, params=target_params, display=display)
+
+        # Filter library rows based on target parameters that are string
+        mask = np.ones(len(self.df), dtype=bool)
+        for param, value in target_params.items():
+            if isinstance(value, str):
+                mask &= self._categorical_mask(self.df, param, value)
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            categorical_params = {key: value for key, value in target_params.items() if isinstance(value, str)}
+            raise ValueError(f'No designs in the library match the categorical parameters {categorical_params}.')
 
         # Set strategy dynamically based on the metric parameter
-        if metric == 'Euclidean':
-            self.set_metric_strategy(EuclideanMetric())
-        elif metric == 'Manhattan':
-            self.set_metric_strategy(ManhattanMetric())
-        elif metric == 'Chebyshev':
-            self.set_metric_strategy(ChebyshevMetric())
+        if metric in _METRIC_SINGLETONS:
+            self.set_metric_strategy(_METRIC_SINGLETONS[metric])
         elif metric == 'Weighted Euclidean':
             self.set_metric_strategy(WeightedEuclideanMetric(self.metric_weights))
         elif metric == 'Custom':
@@ -259,28 +481,87 @@ class Analyzer:
 
         # Main logic
 
-        # Filter DataFrame based on target parameters that are string
-        for param, value in target_params.items():
-            if isinstance(value, str):
-                filtered_df = filtered_df[filtered_df[param] == value]
-
-        # Calculate distances
-        distances = filtered_df.apply(lambda row: self.metric_strategy.calculate(target_params, row), axis=1)
-
-        # Sort distances and get the closest ones
-        sorted_indices = distances.nsmallest(num_top).index
-        closest_df = self.df.loc[sorted_indices]
+        # Calculate distances on the numerical columns in one pass
+        numeric_keys = [key for key, value in target_params.items() if isinstance(value, (int, float))]
+        target_vector = np.array([target_params[key] for key in numeric_keys], dtype=precision)
+        minkowski_p = {'Manhattan': 1, 'Chebyshev': np.inf}.get(metric)
+        # Unscaled metrics can reuse a KD-tree across queries on the same library
+        tree = self._kdtree(numeric_keys, target_params, mask, precision) if minkowski_p is not None else None
+        if tree is not None:
+            k = min(num_top, len(candidates))
+            distances, top = tree.query(target_vector, k=k, p=minkowski_p)
+            if k < len(candidates):
+                # Designs tied with the k-th nearest one may have been left out; fetch them all so
+                # that, as below, ties are broken by library order
+                n_within = tree.query_ball_point(target_vector, r=np.atleast_1d(distances)[-1], p=minkowski_p, return_length=True)
+                if n_within > k:
+                    distances, top = tree.query(target_vector, k=int(n_within), p=minkowski_p)
+            distances, top = np.atleast_1d(distances), np.atleast_1d(top)
+            top = top[np.lexsort((top, distances))][:k]
+        else:
+            X = self._numeric_matrix(numeric_keys, precision)
+            if not mask.all():
+                X = X[mask]
+            X_sq = None
+            if self.metric_strategy.needs_sq(precision):
+                X_sq = self._numeric_matrix(numeric_keys, precision, squared=True)
+                if not mask.all():
+                    X_sq = X_sq[mask]
+            try:
+                distances = self.metric_strategy.calculate_batch(target_vector, X, numeric_keys, X_sq=X_sq)
+            except NotImplementedError:
+                filtered_df = self.df.iloc[candidates][list(target_params)]
+                distances = filtered_df.apply(lambda row: self.metric_strategy.calculate(target_params, row), axis=1).to_numpy(dtype=np.float64)
+
+            # Partially sort distances and get the closest ones (ties keep library order); designs
+            # with missing parameters have NaN distances and are never returned
+            ranked = np.flatnonzero(~np.isnan(distances))
+            if num_top < len(ranked):
+                # Keep every design tied with the num_top-th one, which argpartition picks among arbitrarily
+                kth = distances[ranked[np.argpartition(distances[ranked], num_top - 1)[num_top - 1]]]
+                top = ranked[distances[ranked] <= kth]
+            else:
+                top = ranked
+            top = top[np.lexsort((top, distances[top]))][:num_top]
+        closest_df = self.df.iloc[candidates[top]]
 
         # store the best design 
+        best_pos = candidates[top[0]]
         self.closest_df_entry = closest_df.iloc[0]
-        self.closest_design = closest_df.iloc[0]["design_options"]
+        self.closest_design = self._design_option("design_options", best_pos)
 
-        if len(self.selected_system) == 2: #TODO: make this more general
-            self.presimmed_closest_cpw_design = self.closest_df_entry["design_options_cavity_claw"]
-            self.presimmed_closest_qubit_design = self.closest_df_entry["design_options_qubit"]
+        if system_key(self.selected_system) == QUBIT_CAVITY_SYSTEM: #TODO: make this more general
+            self.presimmed_closest_cpw_design = self._design_option("design_options_cavity_claw", best_pos)
+            self.presimmed_closest_qubit_design = self._design_option("design_options_qubit", best_pos)
 
         return closest_df
 
+    def _kdtree(self, numeric_keys, target_params, mask, precision):
+        """
+        Return the KD-tree over the `numeric_keys` columns of the rows of `self.df` selected by `mask`,
+        building it on first use.
+
+        Trees are cached per set of numerical keys, categorical target values and precision, and
+        are dropped whenever the Hamiltonian parameter columns of `self.df` are recomputed.
+
+        Args:
+            numeric_keys (list): Names of the numerical columns.
+            target_params (dict): Target parameters used to filter the library.
+            mask (np.ndarray): Boolean array selecting the rows matching the categorical targets.
+            precision (str): Floating point type of the tree.
+
+        Returns:
+            cKDTree or None: KD-tree over the selected rows, or None if any of them holds a NaN or
+            infinite value, which a KD-tree cannot index; those libraries must be scanned instead.
+        """
+        key = (tuple(numeric_keys), tuple((param, value) for param, value in target_params.items() if isinstance(value, str)), precision)
+        if key not in self._kdtrees:
+            X = self._numeric_matrix(numeric_keys, precision)
+            if not mask.all():
+                X = X[mask]
+            self._kdtrees[key] = cKDTree(X) if np.isfinite(X).all() else None
+        return self._kdtrees[key]
+
     def get_interpolated_design(self,
                      target_params: dict,
                      metric: str = 'Euclidean',
@@ -294,7 +575,7 @@ class Analyzer:
         """
         Extracts the design parameters from the dataframe and returns a dict.
         """
-        return df["design_options"].to_dict()[0]
+        return df["design_options"].iat[0]
 
     def get_param(self, design, param):
         """
@@ -312,21 +593,30 @@ class Analyzer:
         Returns:
             None
         """
+        # Plotting libraries are only needed here, so keep them off the import path
+        import matplotlib
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         # Set Seaborn style and context
         sns.set_style("whitegrid")
         sns.set_context("paper", font_scale=1.4)
 
         # Create a colormap for the scatter plot points
-        viridis_cmap = plt.cm.get_cmap('viridis')
+        viridis_cmap = matplotlib.colormaps['viridis']
         color_sim = viridis_cmap(0.2)
         color_presim = viridis_cmap(0.9)
         color_database = viridis_cmap(0.6)
 
+        # Pull the library columns out once as plain arrays; the background cloud is drawn with
+        # plot() (one marker path stamped per point) rather than scatter(), which keeps per-point sizes and colors
+        presim = {key: self.df[key].to_numpy() for key in ("cavity_frequency_GHz", "kappa_kHz", "anharmonicity_MHz", "g_MHz")}
+
         # Create the figure with two subplots
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
 
         # First subplot: kappa_kHz vs fres
-        ax1.scatter(x=self.df['cavity_frequency_GHz'], y=self.df['kappa_kHz'], color=color_presim, marker=".", s=50, label="Pre-Simulated")
+        ax1.plot(presim['cavity_frequency_GHz'], presim['kappa_kHz'], linestyle="none", color=color_presim, marker=".", markersize=np.sqrt(50), label="Pre-Simulated")
         ax1.scatter(x=self.target_params["cavity_frequency_GHz"], y=self.target_params["kappa_kHz"], color='red', s=100, marker='x', label='Target')
         closest_fres = self.closest_df_entry["cavity_frequency_GHz"]
         closest_kappa_kHz = self.closest_df_entry["kappa_kHz"]
@@ -339,7 +629,7 @@ class Analyzer:
             text.set_fontweight('bold')
 
         # Second subplot: g vs alpha
-        ax2.scatter(x=self.df['anharmonicity_MHz'], y=self.df['g_MHz'], color=color_presim, marker=".", s=50, label="Pre-Simulated")
+        ax2.plot(presim['anharmonicity_MHz'], presim['g_MHz'], linestyle="none", color=color_presim, marker=".", markersize=np.sqrt(50), label="Pre-Simulated")
         ax2.scatter(x=self.target_params["anharmonicity_MHz"], y=self.target_params["g_MHz"], color='red', s=100, marker='x', label='Target')
         closest_alpha = [self.closest_df_entry["anharmonicity_MHz"]]
         closest_g = [self.closest_df_entry["g_MHz"]]
@@ -353,3 +643,11 @@ class Analyzer:
 
         plt.tight_layout()
         plt.show()
+
+# Analyzer method adding the Hamiltonian parameter columns of each system, if any
+_H_PARAM_ADDERS = {
+    "qubit": Analyzer._add_qubit_H_params,
+    "cavity_claw": Analyzer._fix_cavity_claw_df,
+    "coupler": None,
+    QUBIT_CAVITY_SYSTEM: Analyzer._add_qubit_cavity_H_params,
+}
@@ -370,10 +370,12 @@ class SQuADDS_DB(metaclass=SingletonMeta):
         return df
 
     def create_qubit_cavity_df(self, qubit_df, cavity_df, merger_terms=None):
+        # process the dfs to make them ready for merger (walk each nested dict once, not once per term)
+        qubit_claws = [x['connection_pads']['c'] for x in qubit_df['design_options']]
+        cavity_claws = [x['claw_opts']['connection_pads']['readout'] for x in cavity_df['design_options']]
         for merger_term in merger_terms:
-            # process the dfs to make them ready for merger
-            qubit_df[merger_term] = qubit_df['design_options'].apply(lambda x: x['connection_pads']['c'][merger_term])
-            cavity_df[merger_term] = cavity_df['design_options'].apply(lambda x: x['claw_opts']['connection_pads']['readout'][merger_term])
+            qubit_df[merger_term] = [claw[merger_term] for claw in qubit_claws]
+            cavity_df[merger_term] = [claw[merger_term] for claw in cavity_claws]
 
         # Merging the data frames based on merger terms
         merged_df = pd.merge(qubit_df, cavity_df, on=merger_terms, how="inner", suffixes=('_qubit', '_cavity_claw'))
@@ -381,8 +383,10 @@ class SQuADDS_DB(metaclass=SingletonMeta):
         # Dropping the merger terms
         merged_df.drop(columns=merger_terms, inplace=True)
 
-        # Combining the qubit and cavity design options into one
-        merged_df['design_options'] = merged_df.apply(create_unified_design_options, axis=1)
+        # Combining the qubit and cavity design options into one (zipping the needed columns avoids boxing each row in a Series)
+        option_columns = [column for column in ("design_options_cavity_claw", "design_options_qubit", "coupler_type") if column in merged_df.columns]
+        merged_df['design_options'] = [create_unified_design_options(dict(zip(option_columns, values)))
+                                       for values in zip(*(merged_df[column] for column in option_columns))]
 
         return merged_df
 
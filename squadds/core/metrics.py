@@ -3,12 +3,16 @@ import pandas as pd
 import numpy as np
 from numpy import linalg as LA
 import logging
+from squadds.core._metric_kernels import COMPILED, weighted_relative_sq, weighted_relative_sq_expanded, manhattan, chebyshev
 
 logging.basicConfig(level=logging.INFO)
 
 class MetricStrategy(ABC):
     """Abstract class for metric strategies."""
 
+    # Whether `calculate_batch` can expand the distance into matrix-vector products against X**2
+    expands_squares = False
+
     @abstractmethod
     def calculate(self, target_params: dict, row: pd.Series) -> float:
         """Calculate the distance metric between target parameters and a DataFrame row.
@@ -22,9 +26,43 @@ class MetricStrategy(ABC):
         """
         raise NotImplementedError("This method should be overridden by subclass")
 
+    def calculate_batch(self, target_vector: np.ndarray, X: np.ndarray, keys: list, X_sq: np.ndarray = None) -> np.ndarray:
+        """Calculate the distance metric between target parameters and every row of a matrix.
+
+        Strategies that can be expressed as array reductions override this method. The default
+        raises NotImplementedError, in which case callers fall back to `calculate` row by row.
+
+        Args:
+            target_vector (np.ndarray): Numerical target parameters, ordered as `keys`.
+            X (np.ndarray): Matrix with one row per design and one column per key.
+            keys (list): Column names of `X`.
+            X_sq (np.ndarray, optional): Precomputed `X**2`. Metrics that can expand their distance
+                into matrix-vector products use it; others ignore it.
+
+        Returns:
+            np.ndarray: Calculated distance for each row of `X`.
+        """
+        raise NotImplementedError("This metric does not support batch calculation")
+
+    def needs_sq(self, dtype) -> bool:
+        """Whether `calculate_batch` should be given a precomputed `X**2` for a matrix of type `dtype`.
+
+        Without compiled kernels, float64 scans are cheaper as BLAS products against a cached X**2;
+        in float32 the expansion cancels too badly to rank close matches.
+
+        Args:
+            dtype (np.dtype or str): Floating point type of the matrix.
+
+        Returns:
+            bool: True if `X_sq` should be passed to `calculate_batch`.
+        """
+        return self.expands_squares and not COMPILED and np.dtype(dtype) == np.float64
+
 class EuclideanMetric(MetricStrategy):
     """Implements the specific Euclidean metric strategy as per your definition."""
 
+    expands_squares = True
+
     def calculate(self, target_params, df_row):
         """Calculate the custom Euclidean distance between target_params and df_row.
 
@@ -44,6 +82,15 @@ class EuclideanMetric(MetricStrategy):
                 distance += ((df_row[column] - target_value)**2 / target_value**2)
         return np.sqrt(distance)
 
+    def calculate_batch(self, target_vector, X, keys, X_sq=None):
+        """Vectorized form of `calculate` over all rows of `X`."""
+        weights = np.ones(len(keys), dtype=X.dtype)
+        if X_sq is not None:
+            squared = weighted_relative_sq_expanded(X, X_sq, target_vector, weights)
+            # Rounding in the expansion can leave exact matches slightly below zero
+            return np.sqrt(np.maximum(squared, 0, out=squared))
+        return np.sqrt(weighted_relative_sq(X, target_vector, weights))
+
 class ManhattanMetric(MetricStrategy):
     """Implements the Manhattan metric strategy."""
 
@@ -61,6 +108,10 @@ class ManhattanMetric(MetricStrategy):
         row_vector = np.array([df_row[key] for key in target_params])
         return LA.norm(target_vector - row_vector, ord=1)
 
+    def calculate_batch(self, target_vector, X, keys, X_sq=None):
+        """Vectorized form of `calculate` over all rows of `X`."""
+        return manhattan(X, target_vector)
+
 
 class ChebyshevMetric(MetricStrategy):
     """Implements the Chebyshev metric strategy."""
@@ -79,10 +130,16 @@ class ChebyshevMetric(MetricStrategy):
         row_vector = np.array([df_row[key] for key in target_params])
         return LA.norm(target_vector - row_vector, ord=np.inf)
 
+    def calculate_batch(self, target_vector, X, keys, X_sq=None):
+        """Vectorized form of `calculate` over all rows of `X`."""
+        return chebyshev(X, target_vector)
+
 
 class WeightedEuclideanMetric(MetricStrategy):
     """Concrete class for weighted Euclidean metric."""
 
+    expands_squares = True
+
     def __init__(self, weights: dict):
         """Initialize the weights.
 
@@ -112,6 +169,18 @@ class WeightedEuclideanMetric(MetricStrategy):
                 distance += weight * ((target_value - simulated_value) ** 2) / target_value**2
         return distance
 
+    def calculate_batch(self, target_vector, X, keys, X_sq=None):
+        """Vectorized form of `calculate` over all rows of `X`."""
+        if self.weights is None:
+            self.weights = {key: 1 for key in keys}
+            logging.info(f"\033[1mNOTE TO USER:\033[0m No metric weights provided. Using default weights of 1 for all parameters.")
+        weights = np.array([self.weights.get(key, 1) for key in keys], dtype=X.dtype)
+        if X_sq is not None:
+            distances = weighted_relative_sq_expanded(X, X_sq, target_vector, weights)
+            # Rounding in the expansion can leave exact matches slightly below zero
+            return np.maximum(distances, 0, out=distances)
+        return weighted_relative_sq(X, target_vector, weights)
+
 class CustomMetric(MetricStrategy):
     """Implements a custom metric strategy using a user-defined function.
 
@@ -64,7 +64,7 @@ def create_unified_design_options(row):
     Create a unified design options dictionary based on the given row.
 
     Args:
-        row (pandas.Series): The row containing the design options.
+        row (pandas.Series or dict): The row containing the design options.
 
     Returns:
         dict: The unified design options dictionary.
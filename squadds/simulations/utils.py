@@ -220,7 +220,8 @@ def create_coupler(opts, design):
     return cplr
 
 def create_cpw(opts, cplr, design):
-    adj_distance = int("".join(filter(str.isdigit, cplr.options["coupling_length"]))) if int("".join(filter(str.isdigit, cplr.options["coupling_length"]))) > 150 else 0
+    coupling_length = design.parse_value(cplr.options["coupling_length"]) * 1000 # mm -> um
+    adj_distance = coupling_length if coupling_length > 150 else 0
     jogs = OrderedDict()
     jogs[0] = ["R90", f'{adj_distance/(1.5)}um']
     opts.update({"lead" : Dict(